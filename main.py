@@ -1,304 +1,518 @@
-import re
-import sys
-
-# Define tokens
-class Token:
-    def __init__(self, type_, value):
-        self.type = type_
-        self.value = value
-
-    def __repr__(self):
-        return f"Token({self.type}, {repr(self.value)})"
-
-# Tokenizer (Lexical Analysis)
-class Tokenizer:
-    def __init__(self, code):
-        self.code = code
-        self.position = 0
-        self.current_char = self.code[self.position] if self.position < len(self.code) else None
-
-    def advance(self):
-        self.position += 1
-        if self.position < len(self.code):
-            self.current_char = self.code[self.position]
-        else:
-            self.current_char = None
-
-    def skip_whitespace(self):
-        while self.current_char and self.current_char.isspace():
-            self.advance()
-
-    def get_next_token(self):
-        self.skip_whitespace()
-
-        if self.current_char is None:
-            return Token('EOF', None)
-
-        if self.current_char.isdigit():
-            return self.number()
-
-        if self.current_char.isalpha():
-            return self.identifier()
-
-        if self.current_char == '+':
-            self.advance()
-            return Token('PLUS', '+')
-
-        if self.current_char == '-':
-            self.advance()
-            return Token('MINUS', '-')
-
-        if self.current_char == '*':
-            self.advance()
-            return Token('MUL', '*')
-
-        if self.current_char == '/':
-            self.advance()
-            return Token('DIV', '/')
-
-        if self.current_char == '=':
-            self.advance()
-            return Token('ASSIGN', '=')
-
-        if self.current_char == '(':
-            self.advance()
-            return Token('LPAREN', '(')
-
-        if self.current_char == ')':
-            self.advance()
-            return Token('RPAREN', ')')
-
-        if self.current_char == '{':
-            self.advance()
-            return Token('LBRACE', '{')
-
-        if self.current_char == '}':
-            self.advance()
-            return Token('RBRACE', '}')
-
-        if self.current_char == ',':
-            self.advance()
-            return Token('COMMA', ',')
-
-        raise Exception(f"Illegal character '{self.current_char}'")
-
-    def number(self):
-        num = ''
-        while self.current_char and self.current_char.isdigit():
-            num += self.current_char
-            self.advance()
-        return Token('NUMBER', int(num))
-
-    def identifier(self):
-        id_str = ''
-        while self.current_char and (self.current_char.isalnum() or self.current_char == '_'):
-            id_str += self.current_char
-            self.advance()
-        if id_str == 'if':
-            return Token('IF', 'if')
-        elif id_str == 'else':
-            return Token('ELSE', 'else')
-        elif id_str == 'while':
-            return Token('WHILE', 'while')
-        elif id_str == 'function':
-            return Token('FUNCTION', 'function')
-        return Token('ID', id_str)
-
-    def peek(self):
-        peek_pos = self.position + 1
-        if peek_pos < len(self.code):
-            return self.code[peek_pos]
-        return None
-
-# Abstract Syntax Tree (AST) Nodes
-class AST:
-    pass
-
-class BinOp(AST):
-    def __init__(self, left, op, right):
-        self.left = left
-        self.op = op
-        self.right = right
-
-class Num(AST):
-    def __init__(self, token):
-        self.token = token
-        self.value = token.value
-
-class Var(AST):
-    def __init__(self, token):
-        self.token = token
-        self.name = token.value
-
-class Assign(AST):
-    def __init__(self, left, right):
-        self.left = left
-        self.right = right
-
-class If(AST):
-    def __init__(self, condition, true_body, false_body=None):
-        self.condition = condition
-        self.true_body = true_body
-        self.false_body = false_body
-
-class While(AST):
-    def __init__(self, condition, body):
-        self.condition = condition
-        self.body = body
-
-class FunctionDef(AST):
-    def __init__(self, name, params, body):
-        self.name = name
-        self.params = params
-        self.body = body
-
-class FunctionCall(AST):
-    def __init__(self, name, args):
-        self.name = name
-        self.args = args
-
-# Parser (Syntax Analysis)
-class Parser:
-    def __init__(self, tokenizer):
-        self.tokenizer = tokenizer
-        self.current_token = self.tokenizer.get_next_token()
-
-    def eat(self, token_type):
-        if self.current_token.type == token_type:
-            self.current_token = self.tokenizer.get_next_token()
-        else:
-            raise Exception(f"Expected {token_type}, found {self.current_token.type}")
-
-    def factor(self):
-        token = self.current_token
-        if token.type == 'NUMBER':
-            self.eat('NUMBER')
-            return Num(token)
-        elif token.type == 'ID':
-            self.eat('ID')
-            return Var(token)
-        elif token.type == 'LPAREN':
-            self.eat('LPAREN')
-            node = self.expr()
-            self.eat('RPAREN')
-            return node
-
-    def term(self):
-        node = self.factor()
-        while self.current_token.type in ('MUL', 'DIV'):
-            token = self.current_token
-            if token.type == 'MUL':
-                self.eat('MUL')
-            elif token.type == 'DIV':
-                self.eat('DIV')
-            node = BinOp(left=node, op=token, right=self.factor())
-        return node
-
-    def expr(self):
-        node = self.term()
-        while self.current_token.type in ('PLUS', 'MINUS'):
-            token = self.current_token
-            if token.type == 'PLUS':
-                self.eat('PLUS')
-            elif token.type == 'MINUS':
-                self.eat('MINUS')
-            node = BinOp(left=node, op=token, right=self.term())
-        return node
-
-    def assignment_statement(self):
-        left = Var(self.current_token)
-        self.eat('ID')
-        self.eat('ASSIGN')
-        right = self.expr()
-        return Assign(left, right)
-
-    def statement(self):
-        if self.current_token.type == 'ID':
-            next_char = self.tokenizer.peek()
-            if next_char == '=':
-                return self.assignment_statement()
-            else:
-                return self.expr()
-        else:
-            return self.expr()
-
-    def parse(self):
-        return self.statement()
-
-# Interpreter (Evaluation)
-class Interpreter:
-    def __init__(self, parser):
-        self.parser = parser
-        self.variables = {}
-
-    def visit_BinOp(self, node):
-        left = self.visit(node.left)
-        right = self.visit(node.right)
-        if node.op.type == 'PLUS':
-            return left + right
-        elif node.op.type == 'MINUS':
-            return left - right
-        elif node.op.type == 'MUL':
-            return left * right
-        elif node.op.type == 'DIV':
-            return left / right
-
-    def visit_Num(self, node):
-        return node.value
-
-    def visit_Var(self, node):
-        var_name = node.name
-        if var_name not in self.variables:
-            raise Exception(f"Undefined variable '{var_name}'")
-        return self.variables[var_name]
-
-    def visit_Assign(self, node):
-        var_name = node.left.name
-        value = self.visit(node.right)
-        self.variables[var_name] = value
-        return value
-
-    def interpret(self):
-        tree = self.parser.parse()
-        return self.visit(tree)
-
-    def visit(self, node):
-        method_name = f'visit_{type(node).__name__}'
-        method = getattr(self, method_name, self.generic_visit)
-        return method(node)
-
-    def generic_visit(self, node):
-        raise Exception(f"No visit_{type(node).__name__} method")
-
-# Memory Management
-class Memory:
-    def __init__(self):
-        self.variables = {}
-
-    def set_var(self, name, value):
-        self.variables[name] = value
-
-    def get_var(self, name):
-        return self.variables.get(name, None)
-
-# Main execution
-def main():
-    interpreter = Interpreter(None)
-    while True:
-        try:
-            text = input('c-interpreter> ')
-            if text.strip() == 'exit':
-                break
-
-            tokenizer = Tokenizer(text)
-            parser = Parser(tokenizer)
-            interpreter.parser = parser
-            result = interpreter.interpret()
-            print(f"Result: {result}")
-            print(f"Variables: {interpreter.variables}")
-
-        except Exception as e:
-            print(f"Error: {e}")
-
-if __name__ == '__main__':
-    main()
+import functools
+import operator
+import os
+import re
+import sys
+from array import array
+
+# Optional JIT backend: when numba is installed the bytecode dispatch
+# loop runs as compiled machine code over numeric arrays. It computes
+# in float64 (so large ints lose exactness and results print as
+# floats), so it is opt-in via INTERPREC_JIT=1 rather than switched on
+# by numba merely being importable.
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+_USE_JIT = os.environ.get('INTERPREC_JIT') == '1'
+
+# Define tokens
+class Token:
+    __slots__ = ('type', 'value')
+
+    def __init__(self, type_, value):
+        self.type = type_
+        self.value = value
+
+    def __repr__(self):
+        return f"Token({self.type}, {repr(self.value)})"
+
+# Tokenizer (Lexical Analysis)
+# The language is ASCII-only, so the source is scanned as bytes: byte
+# indexing skips str's Unicode decoding and the pattern's \s/\d/\w
+# classes stay ASCII-only.
+_TOKEN_RE = re.compile(
+    rb'(?P<WS>\s+)'
+    rb'|(?P<NUMBER>\d+)'
+    rb'|(?P<ID>[A-Za-z_]\w*)'
+    rb'|(?P<PUNCT>[+\-*/=(){},])'
+)
+
+_EOF = Token('EOF', None)
+
+class Tokenizer:
+    # Fixed lexemes always produce the same token, so share one instance
+    # per lexeme instead of allocating a fresh Token on every match.
+    # Punctuation is resolved by a single dict lookup on the matched
+    # byte; the tables live on the class so reset() keeps them warm.
+    SINGLE = {
+        b'+': Token('PLUS', '+'),
+        b'-': Token('MINUS', '-'),
+        b'*': Token('MUL', '*'),
+        b'/': Token('DIV', '/'),
+        b'=': Token('ASSIGN', '='),
+        b'(': Token('LPAREN', '('),
+        b')': Token('RPAREN', ')'),
+        b'{': Token('LBRACE', '{'),
+        b'}': Token('RBRACE', '}'),
+        b',': Token('COMMA', ','),
+    }
+
+    KEYWORDS = {
+        b'if': Token('IF', 'if'),
+        b'else': Token('ELSE', 'else'),
+        b'while': Token('WHILE', 'while'),
+        b'function': Token('FUNCTION', 'function'),
+    }
+
+    def __init__(self, code=''):
+        self.reset(code)
+
+    def reset(self, code):
+        try:
+            self.code = code.encode('ascii')
+        except UnicodeEncodeError as err:
+            raise Exception(f"Illegal character '{code[err.start]}'") from None
+        self.position = 0
+
+    def get_next_token(self):
+        code = self.code
+        while self.position < len(code):
+            match = _TOKEN_RE.match(code, self.position)
+            if match is None:
+                raise Exception(f"Illegal character '{chr(code[self.position])}'")
+            self.position = match.end()
+            kind = match.lastgroup
+            if kind == 'WS':
+                continue
+            if kind == 'NUMBER':
+                return Token('NUMBER', int(match.group()))
+            if kind == 'ID':
+                raw = match.group()
+                keyword = self.KEYWORDS.get(raw)
+                if keyword:
+                    return keyword
+                # Interned names make later dict lookups identity-fast.
+                return Token('ID', sys.intern(raw.decode('ascii')))
+            return self.SINGLE[match.group()]
+        return _EOF
+
+# Bytecode
+LOAD_CONST = 0
+LOAD_VAR = 1
+STORE_VAR = 2
+BIN_ADD = 3
+BIN_SUB = 4
+BIN_MUL = 5
+BIN_DIV = 6
+
+# Instructions are stored as parallel arrays (opcodes alongside args)
+# rather than a list of tuples, so the dispatch loop streams through
+# contiguous memory instead of chasing per-instruction objects.
+class Code:
+    def __init__(self):
+        self.opcodes = []
+        self.args = []
+        self.consts = []
+        self.arrays = None
+
+    def emit(self, op, arg=0):
+        self.opcodes.append(op)
+        self.args.append(arg)
+
+    def freeze(self):
+        self.opcodes = array('b', self.opcodes)
+        self.args = array('i', self.args)
+
+    def jit_arrays(self):
+        # int64 opcode/arg arrays plus float64 consts, built once per Code.
+        if self.arrays is None:
+            ops = np.array(self.opcodes, dtype=np.int64)
+            args = np.array(self.args, dtype=np.int64)
+            consts = np.array(self.consts, dtype=np.float64)
+            self.arrays = (ops, args, consts)
+        return self.arrays
+
+# Marks a variable slot that has been allocated but never assigned.
+_UNDEFINED = object()
+
+# Variables get a small integer slot on first sight during parsing, so
+# references index a list instead of hashing a name into a dict.
+class SymbolTable:
+    def __init__(self):
+        self.slots = {}
+        self.names = []
+
+    def slot(self, name):
+        idx = self.slots.get(name)
+        if idx is None:
+            idx = len(self.names)
+            self.slots[name] = idx
+            self.names.append(name)
+        return idx
+
+def run(code, env, names):
+    opcodes = code.opcodes
+    args = code.args
+    consts = code.consts
+    stack = []
+    pc = 0
+    n = len(opcodes)
+    while pc < n:
+        op = opcodes[pc]
+        arg = args[pc]
+        if op == LOAD_CONST:
+            stack.append(consts[arg])
+        elif op == LOAD_VAR:
+            value = env[arg]
+            if value is _UNDEFINED:
+                raise Exception(f"Undefined variable '{names[arg]}'")
+            stack.append(value)
+        elif op == STORE_VAR:
+            env[arg] = stack[-1]
+        elif op == BIN_ADD:
+            right = stack.pop()
+            stack[-1] = stack[-1] + right
+        elif op == BIN_SUB:
+            right = stack.pop()
+            stack[-1] = stack[-1] - right
+        elif op == BIN_MUL:
+            right = stack.pop()
+            stack[-1] = stack[-1] * right
+        elif op == BIN_DIV:
+            right = stack.pop()
+            stack[-1] = stack[-1] / right
+        pc += 1
+    return stack.pop()
+
+if njit is not None:
+    @njit(cache=True)
+    def run_jit(ops, args, consts, env):
+        stack = np.empty(len(ops), dtype=np.float64)
+        sp = -1
+        pc = 0
+        n = len(ops)
+        while pc < n:
+            op = ops[pc]
+            arg = args[pc]
+            if op == LOAD_CONST:
+                sp += 1
+                stack[sp] = consts[arg]
+            elif op == LOAD_VAR:
+                sp += 1
+                stack[sp] = env[arg]
+            elif op == STORE_VAR:
+                env[arg] = stack[sp]
+            elif op == BIN_ADD:
+                stack[sp - 1] = stack[sp - 1] + stack[sp]
+                sp -= 1
+            elif op == BIN_SUB:
+                stack[sp - 1] = stack[sp - 1] - stack[sp]
+                sp -= 1
+            elif op == BIN_MUL:
+                stack[sp - 1] = stack[sp - 1] * stack[sp]
+                sp -= 1
+            elif op == BIN_DIV:
+                stack[sp - 1] = stack[sp - 1] / stack[sp]
+                sp -= 1
+            pc += 1
+        return stack[sp]
+else:
+    run_jit = None
+
+# Abstract Syntax Tree (AST) Nodes
+class AST:
+    __slots__ = ()
+
+# Operator dispatch is decided once at parse time: each operator is its
+# own node class with the arithmetic inlined in eval.
+class BinOp(AST):
+    __slots__ = ('left', 'op', 'right')
+
+    fn = None
+    opcode = None
+
+    def __init__(self, left, op, right):
+        self.left = left
+        self.op = op
+        self.right = right
+
+    def compile(self, code):
+        self.left.compile(code)
+        self.right.compile(code)
+        code.emit(self.opcode)
+
+class AddOp(BinOp):
+    __slots__ = ()
+    fn = staticmethod(operator.add)
+    opcode = BIN_ADD
+
+    def eval(self, env):
+        return self.left.eval(env) + self.right.eval(env)
+
+class SubOp(BinOp):
+    __slots__ = ()
+    fn = staticmethod(operator.sub)
+    opcode = BIN_SUB
+
+    def eval(self, env):
+        return self.left.eval(env) - self.right.eval(env)
+
+class MulOp(BinOp):
+    __slots__ = ()
+    fn = staticmethod(operator.mul)
+    opcode = BIN_MUL
+
+    def eval(self, env):
+        return self.left.eval(env) * self.right.eval(env)
+
+class DivOp(BinOp):
+    __slots__ = ()
+    fn = staticmethod(operator.truediv)
+    opcode = BIN_DIV
+
+    def eval(self, env):
+        return self.left.eval(env) / self.right.eval(env)
+
+_BIN_CLASSES = {'PLUS': AddOp, 'MINUS': SubOp, 'MUL': MulOp, 'DIV': DivOp}
+
+# Left binding powers for the Pratt expression loop; token types not in
+# the table end an expression.
+_LBP = {'PLUS': 10, 'MINUS': 10, 'MUL': 20, 'DIV': 20}
+
+class Num(AST):
+    __slots__ = ('token', 'value')
+
+    def __init__(self, token):
+        self.token = token
+        self.value = token.value
+
+    def eval(self, env):
+        return self.value
+
+    def compile(self, code):
+        code.emit(LOAD_CONST, len(code.consts))
+        code.consts.append(self.value)
+
+# Shared Num nodes for small integer literals, mirroring CPython's
+# small-int cache.
+_SMALL_NUMS = [Num(Token('NUMBER', i)) for i in range(-5, 257)]
+
+def make_num(value):
+    if isinstance(value, int) and -5 <= value <= 256:
+        return _SMALL_NUMS[value + 5]
+    return Num(Token('NUMBER', value))
+
+class Var(AST):
+    __slots__ = ('token', 'name', 'slot')
+
+    def __init__(self, token, slot):
+        self.token = token
+        self.name = token.value
+        self.slot = slot
+
+    def eval(self, env):
+        value = env[self.slot] if self.slot < len(env) else _UNDEFINED
+        if value is _UNDEFINED:
+            raise Exception(f"Undefined variable '{self.name}'")
+        return value
+
+    def compile(self, code):
+        code.emit(LOAD_VAR, self.slot)
+
+class Assign(AST):
+    __slots__ = ('left', 'right')
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+
+    def eval(self, env):
+        value = self.right.eval(env)
+        slot = self.left.slot
+        while len(env) <= slot:
+            env.append(_UNDEFINED)
+        env[slot] = value
+        return value
+
+    def compile(self, code):
+        self.right.compile(code)
+        code.emit(STORE_VAR, self.left.slot)
+
+class If(AST):
+    __slots__ = ('condition', 'true_body', 'false_body')
+
+    def __init__(self, condition, true_body, false_body=None):
+        self.condition = condition
+        self.true_body = true_body
+        self.false_body = false_body
+
+class While(AST):
+    __slots__ = ('condition', 'body')
+
+    def __init__(self, condition, body):
+        self.condition = condition
+        self.body = body
+
+class FunctionDef(AST):
+    __slots__ = ('name', 'params', 'body')
+
+    def __init__(self, name, params, body):
+        self.name = name
+        self.params = params
+        self.body = body
+
+class FunctionCall(AST):
+    __slots__ = ('name', 'args')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+# Parser (Syntax Analysis)
+class Parser:
+    def __init__(self, tokenizer, symbols=None):
+        self.tokenizer = tokenizer
+        self.symbols = symbols if symbols is not None else SymbolTable()
+        self.reset()
+
+    def reset(self):
+        self.current_token = self.tokenizer.get_next_token()
+        self.next_token = self.tokenizer.get_next_token()
+
+    def eat(self, token_type):
+        if self.current_token.type == token_type:
+            self.current_token = self.next_token
+            self.next_token = self.tokenizer.get_next_token()
+        else:
+            raise Exception(f"Expected {token_type}, found {self.current_token.type}")
+
+    def factor(self):
+        token = self.current_token
+        if token.type == 'NUMBER':
+            self.eat('NUMBER')
+            return make_num(token.value)
+        elif token.type == 'ID':
+            self.eat('ID')
+            return Var(token, self.symbols.slot(token.value))
+        elif token.type == 'LPAREN':
+            self.eat('LPAREN')
+            node = self.expr()
+            self.eat('RPAREN')
+            return node
+
+    def binop(self, left, op, right):
+        cls = _BIN_CLASSES[op.type]
+        # Fold literal subtrees at parse time so they cost nothing at eval.
+        if isinstance(left, Num) and isinstance(right, Num):
+            return make_num(cls.fn(left.value, right.value))
+        return cls(left, op, right)
+
+    def parse_expr(self, rbp):
+        left = self.factor()
+        lbp = _LBP.get(self.current_token.type, 0)
+        while lbp > rbp:
+            op = self.current_token
+            self.eat(op.type)
+            left = self.binop(left, op, self.parse_expr(lbp))
+            lbp = _LBP.get(self.current_token.type, 0)
+        return left
+
+    def expr(self):
+        return self.parse_expr(0)
+
+    def assignment_statement(self):
+        token = self.current_token
+        left = Var(token, self.symbols.slot(token.value))
+        self.eat('ID')
+        self.eat('ASSIGN')
+        right = self.expr()
+        return Assign(left, right)
+
+    def statement(self):
+        if self.current_token.type == 'ID' and self.next_token.type == 'ASSIGN':
+            return self.assignment_statement()
+        return self.expr()
+
+    def parse(self):
+        return self.statement()
+
+# Interpreter (Evaluation)
+class Interpreter:
+    def __init__(self, parser):
+        self.parser = parser
+        self.symbols = parser.symbols if parser is not None else SymbolTable()
+        self.variables = []
+
+    def compile(self, tree):
+        code = Code()
+        tree.compile(code)
+        code.freeze()
+        return code
+
+    def execute(self, code):
+        env = self.variables
+        names = self.symbols.names
+        while len(env) < len(names):
+            env.append(_UNDEFINED)
+        if run_jit is None or not _USE_JIT:
+            return run(code, env, names)
+        # Undefined-variable checks happen up front; the jitted loop
+        # only sees plain float64 values.
+        for op, arg in zip(code.opcodes, code.args):
+            if op == LOAD_VAR and env[arg] is _UNDEFINED:
+                raise Exception(f"Undefined variable '{names[arg]}'")
+        ops, args, consts = code.jit_arrays()
+        jit_env = np.array([0.0 if v is _UNDEFINED else v for v in env],
+                           dtype=np.float64)
+        result = run_jit(ops, args, consts, jit_env)
+        for op, arg in zip(code.opcodes, code.args):
+            if op == STORE_VAR:
+                env[arg] = jit_env[arg]
+        return result
+
+    def interpret(self):
+        # Adopt the parser's table so Interpreter(Parser(...)) works
+        # without the caller pre-sharing a SymbolTable.
+        self.symbols = self.parser.symbols
+        tree = self.parser.parse()
+        return self.execute(self.compile(tree))
+
+    def var_dict(self):
+        return {name: value
+                for name, value in zip(self.symbols.names, self.variables)
+                if value is not _UNDEFINED}
+
+# Main execution
+def main():
+    interpreter = Interpreter(None)
+    # One Tokenizer/Parser pair serves the whole session; each line just
+    # resets them instead of rebuilding the objects.
+    tokenizer = Tokenizer()
+    parser = Parser(tokenizer, interpreter.symbols)
+
+    # Re-entering a line hits the cache and skips tokenize/parse/compile.
+    @functools.lru_cache(maxsize=1024)
+    def compile_line(text):
+        tokenizer.reset(text)
+        parser.reset()
+        return interpreter.compile(parser.parse())
+
+    while True:
+        try:
+            text = input('c-interpreter> ')
+            if text.strip() == 'exit':
+                break
+
+            result = interpreter.execute(compile_line(text))
+            print(f"Result: {result}")
+            print(f"Variables: {interpreter.var_dict()}")
+
+        except Exception as e:
+            print(f"Error: {e}")
+
+if __name__ == '__main__':
+    main()